@@ -1,60 +1,185 @@
+import heapq
 import os
+import time
 import pytest
 import yaml
 import requests
 import re
 import socket
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.retry import Retry
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 ROOT_DIR = Path(__file__).parent.parent
 PROTOCOL_PATH = ROOT_DIR / "rup-protocol.yaml"
 
+MAX_WORKERS = 32
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3  # seconds; doubles with each further attempt
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Simple regex for http/https URLs
+_URL_RE = re.compile(r'https?://[^\s<>"|]+|www\.[^\s<>"|]+')
+
 
 def extract_urls(data):
     urls = []
-    if isinstance(data, dict):
-        for value in data.values():
-            urls.extend(extract_urls(value))
-    elif isinstance(data, list):
-        for item in data:
-            urls.extend(extract_urls(item))
-    elif isinstance(data, str):
-        # Simple regex for http/https URLs
-        found = re.findall(r'https?://[^\s<>"|]+|www\.[^\s<>"|]+', data)
-        for url in found:
-            # Clean up trailing punctuation often found in text
-            url = url.rstrip('.,;:)')
-            urls.append(url)
+    # Walk the parsed YAML with an explicit stack instead of recursing per node.
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
+        elif node_type is str:
+            # Most leaves hold no URL; two substring scans are far cheaper than the regex.
+            if "://" not in node and "www." not in node:
+                continue
+            for url in _URL_RE.findall(node):
+                # Clean up trailing punctuation often found in text
+                urls.append(url.rstrip('.,;:)'))
     return urls
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def protocol_urls():
-    with open(PROTOCOL_PATH, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-    return set(extract_urls(data))
+    with open(PROTOCOL_PATH, 'rb') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    return frozenset(extract_urls(data))
 
 
 def _should_run_link_checks() -> bool:
     return os.getenv("RUP_LINK_CHECKS", "").lower() in {"1", "true", "yes"}
 
 
-def _fetch_with_retry(url: str, headers: dict[str, str]) -> requests.Response:
-    last_error = None
-    for attempt in range(3):
-        try:
-            response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Retries are scheduled by _check_all, never slept on inside the adapter.
+    adapter = HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(total=0, read=False),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+SESSION = _build_session()
+
+
+def _host_port(url: str) -> tuple[str, int] | None:
+    parts = urlsplit(url)
+    if not parts.hostname:
+        return None
+    try:
+        return parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:  # malformed port
+        return None
+
+
+def _resolve(address: tuple[str, int]) -> tuple[tuple[str, int], list[str]]:
+    try:
+        infos = socket.getaddrinfo(*address, type=socket.SOCK_STREAM)
+    except OSError:
+        return address, []
+    return address, [info[4][0] for info in infos]
+
+
+def _resolve_hosts(urls: list[str], executor: ThreadPoolExecutor) -> dict[tuple[str, int], list[str]]:
+    """Resolve every distinct (host, port) once, concurrently."""
+    addresses = {address for address in map(_host_port, urls) if address}
+    return {address: ips for address, ips in executor.map(_resolve, addresses) if ips}
+
+
+def _cached_create_connection(resolved: dict[tuple[str, int], list[str]]):
+    """Wrap urllib3's create_connection to dial pre-resolved IPs.
+
+    Only the socket address changes; TLS SNI and certificate checks still use
+    the original hostname. Hosts not in ``resolved`` (e.g. redirect targets)
+    go through the normal lookup.
+    """
+    create_connection = urllib3_connection.create_connection
+
+    def connect(address, *args, **kwargs):
+        ips = resolved.get(address)
+        if not ips:
+            return create_connection(address, *args, **kwargs)
+        last_error = None
+        for ip in ips:
+            try:
+                return create_connection((ip, address[1]), *args, **kwargs)
+            except OSError as exc:
+                last_error = exc
+        raise last_error
+
+    return connect
+
+
+def _fetch(url: str) -> requests.Response:
+    response = SESSION.head(url, timeout=5, allow_redirects=True)
+    if response.status_code >= 400:
+        response.close()
+        response = SESSION.get(url, timeout=5, stream=True)
+    return response
+
+
+def _check_one(url: str) -> tuple[str | None, bool]:
+    """Return (problem, retryable); problem is None for a healthy link."""
+    try:
+        with _fetch(url) as response:
             if response.status_code >= 400:
-                response = requests.get(url, headers=headers, timeout=5, stream=True)
-            return response
-        except requests.RequestException as exc:
-            last_error = exc
-            if attempt == 2:
-                raise
-    raise last_error
+                return f"{url} ({response.status_code})", False
+    except requests.RequestException as e:
+        return f"{url} (Error: {str(e)})", True
+    return None, False
+
 
+def _check_all(urls: list[str], executor: ThreadPoolExecutor) -> list[str]:
+    """Check URLs concurrently, retrying transient failures without blocking a worker.
 
-def test_no_broken_links(protocol_urls):
+    A failed attempt is pushed onto a delay queue and resubmitted once its
+    backoff expires, so retries overlap with other URLs' first attempts.
+    """
+    pending = {executor.submit(_check_one, url): (url, 1) for url in urls}
+    delayed: list[tuple[float, str, int]] = []
+    broken_links = []
+
+    while pending or delayed:
+        now = time.monotonic()
+        while delayed and delayed[0][0] <= now:
+            _, url, attempt = heapq.heappop(delayed)
+            pending[executor.submit(_check_one, url)] = (url, attempt)
+
+        timeout = max(0.0, delayed[0][0] - now) if delayed else None
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            url, attempt = pending.pop(future)
+            problem, retryable = future.result()
+            if problem and retryable and attempt < MAX_ATTEMPTS:
+                ready_at = time.monotonic() + RETRY_BACKOFF * 2 ** (attempt - 1)
+                heapq.heappush(delayed, (ready_at, url, attempt + 1))
+            elif problem:
+                broken_links.append(problem)
+
+    return broken_links
+
+
+def test_no_broken_links(protocol_urls, monkeypatch):
     """
     Check all URLs found in the protocol YAML file.
     """
@@ -68,23 +193,15 @@ def test_no_broken_links(protocol_urls):
     except OSError:
         pytest.skip("Network/DNS unavailable; skipping external link checks")
 
-    broken_links = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     # Skip example/localhost URLs
     skip_domains = ['example.com', 'localhost', '127.0.0.1', 'rup-protocol.dev']
-
-    for url in protocol_urls:
-        if any(domain in url for domain in skip_domains):
-            continue
-
-        try:
-            response = _fetch_with_retry(url, headers)
-            if response.status_code >= 400:
-                broken_links.append(f"{url} ({response.status_code})")
-        except requests.RequestException as e:
-            broken_links.append(f"{url} (Error: {str(e)})")
+    urls = [url for url in protocol_urls if not any(domain in url for domain in skip_domains)]
+
+    # Link checks are RTT-bound, so run them concurrently over the shared session,
+    # resolving each host once up front instead of once per connection.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        resolved = _resolve_hosts(urls, executor)
+        monkeypatch.setattr(urllib3_connection, "create_connection", _cached_create_connection(resolved))
+        broken_links = sorted(_check_all(urls, executor))
 
     assert not broken_links, "Found broken links:\n" + "\n".join(broken_links)
@@ -0,0 +1,145 @@
+import multiprocessing
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT_DIR = Path(__file__).parent.parent
+LINT_SCRIPT = ROOT_DIR / "tools" / "lint_docs.py"
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _lint(repo, *args):
+    return subprocess.run(
+        [sys.executable, str(LINT_SCRIPT), *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        cwd=repo,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    # A base commit with a lint error, then a clean commit on top of it.
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "old.md").write_text("tab\there\n", encoding="utf-8")
+    _git(tmp_path, "add", "old.md")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "tag", "base")
+    (tmp_path / "new.md").write_text("clean\n", encoding="utf-8")
+    _git(tmp_path, "add", "new.md")
+    _git(tmp_path, "commit", "-q", "-m", "change")
+    return tmp_path
+
+
+def test_lint_all_tracked_files(repo):
+    result = _lint(repo)
+
+    assert result.returncode == 1
+    assert "old.md:1: contains tab character" in result.stdout
+
+
+def test_lint_changed_only(repo):
+    result = _lint(repo, "--changed-only", "base")
+
+    assert result.returncode == 0, result.stdout
+    assert "old.md" not in result.stdout
+
+
+def test_lint_changed_only_missing_ref(repo):
+    result = _lint(repo, "--changed-only", "no-such-ref")
+
+    assert result.returncode == 2
+    assert "'no-such-ref'" in result.stdout
+    assert "Traceback" not in result.stderr
+
+
+def test_lint_flags_trailing_nbsp_after_form_feed(tmp_path):
+    # "\x0c" ends a line, so the no-break space trails line 3.
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "doc.md").write_bytes("page\x0cbreak\ntext\u00a0\n".encode("utf-8"))
+    _git(tmp_path, "add", "doc.md")
+
+    result = _lint(tmp_path)
+
+    assert result.returncode == 1
+    assert "doc.md:3: trailing whitespace" in result.stdout
+
+
+def test_lint_flags_trailing_unicode_whitespace(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "doc.md").write_bytes("em space\u2003\nclean\n".encode("utf-8"))
+    _git(tmp_path, "add", "doc.md")
+
+    result = _lint(tmp_path)
+
+    assert result.returncode == 1
+    assert "doc.md:1: trailing whitespace" in result.stdout
+
+
+def test_lint_reports_deeply_nested_yaml(tmp_path):
+    # Deep enough to overflow libyaml's C stack.
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "deep.yaml").write_text("[" * 100000 + "]" * 100000 + "\n", encoding="utf-8")
+    _git(tmp_path, "add", "deep.yaml")
+
+    result = _lint(tmp_path)
+
+    assert result.returncode == 1
+    assert "deep.yaml: YAML parse error" in result.stdout
+
+
+# Lints with one file killing its worker process, as a crash in libyaml would.
+# Workers look the patched function up in ``__main__``.
+CRASHING_WORKER_DRIVER = """
+import os, sys
+sys.path.insert(0, sys.argv[1])
+import lint_docs
+
+lint_file = lint_docs.lint_file
+
+def crash_on_marked_file(path, c_loader=True):
+    if c_loader and path.name == "crash.md":
+        os._exit(1)
+    return lint_file(path, c_loader)
+
+lint_docs.lint_file = crash_on_marked_file
+sys.exit(lint_docs.main([]))
+"""
+
+
+def test_lint_relints_serially_when_a_worker_dies(tmp_path):
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("workers only inherit the patched function when forked")
+
+    _git(tmp_path, "init", "-q")
+    for i in range(40):  # above PARALLEL_THRESHOLD
+        (tmp_path / f"doc{i:02}.md").write_text("clean\n", encoding="utf-8")
+    (tmp_path / "crash.md").write_text("trailing \n", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+
+    result = subprocess.run(
+        [sys.executable, "-c", CRASHING_WORKER_DRIVER, str(LINT_SCRIPT.parent)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        cwd=tmp_path,
+    )
+
+    assert result.returncode == 1, result.stderr
+    assert "Traceback" not in result.stderr
+    assert "crash.md:1: trailing whitespace" in result.stdout
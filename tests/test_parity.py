@@ -32,6 +32,53 @@ def _check_node_validator():
 
 NODE_AVAILABLE = _check_node_validator()
 
+class ValidatorServer:
+    """A validator kept alive in ``serve`` mode and fed one JSON request per line."""
+
+    def __init__(self, cmd):
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+
+    def run(self, command, file_path, output_type=None):
+        request = {"cmd": command, "path": str(file_path)}
+        if output_type:
+            request["type"] = output_type
+        self.process.stdin.write(json.dumps(request) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Validator server exited with code {self.process.poll()}")
+        response = json.loads(line)
+        return response["code"], response["stdout"], ""
+
+    def close(self):
+        self.process.stdin.close()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+@pytest.fixture(scope="session")
+def python_validator():
+    server = ValidatorServer([sys.executable, str(VALIDATE_PY), "serve"])
+    yield server
+    server.close()
+
+
+@pytest.fixture(scope="session")
+def node_validator():
+    server = ValidatorServer(["node", str(VALIDATE_JS), "serve"])
+    yield server
+    server.close()
+
+
 def run_python_validator(command, file_path, output_type=None):
     cmd = [sys.executable, str(VALIDATE_PY), command, str(file_path)]
     if output_type:
@@ -39,13 +86,6 @@ def run_python_validator(command, file_path, output_type=None):
     result = subprocess.run(cmd, capture_output=True, text=True)
     return result.returncode, result.stdout, result.stderr
 
-def run_node_validator(command, file_path, output_type=None):
-    cmd = ["node", str(VALIDATE_JS), command, str(file_path)]
-    if output_type:
-        cmd.append(output_type)
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode, result.stdout, result.stderr
-
 @pytest.fixture
 def valid_discovery_json(tmp_path):
     data = {
@@ -86,10 +126,16 @@ def invalid_discovery_json(tmp_path):
         json.dump(data, f)
     return path
 
+def test_python_server_matches_cli(python_validator, valid_discovery_json, invalid_discovery_json):
+    for path in (valid_discovery_json, invalid_discovery_json):
+        server_code, server_out, _ = python_validator.run("output", path, "discovery")
+        cli_code, cli_out, _ = run_python_validator("output", path, "discovery")
+        assert (server_code, server_out) == (cli_code, cli_out)
+
 @pytest.mark.skipif(not NODE_AVAILABLE, reason="Node.js not available")
-def test_parity_valid_discovery(valid_discovery_json):
-    py_code, py_out, py_err = run_python_validator("output", valid_discovery_json, "discovery")
-    node_code, node_out, node_err = run_node_validator("output", valid_discovery_json, "discovery")
+def test_parity_valid_discovery(python_validator, node_validator, valid_discovery_json):
+    py_code, py_out, py_err = python_validator.run("output", valid_discovery_json, "discovery")
+    node_code, node_out, node_err = node_validator.run("output", valid_discovery_json, "discovery")
     
     if py_code != 0 or node_code != 0:
         print(f"Python: code={py_code}, out={py_out}, err={py_err}")
@@ -100,9 +146,9 @@ def test_parity_valid_discovery(valid_discovery_json):
     assert "Valid" in node_out
 
 @pytest.mark.skipif(not NODE_AVAILABLE, reason="Node.js not available")
-def test_parity_invalid_discovery(invalid_discovery_json):
-    py_code, py_out, _ = run_python_validator("output", invalid_discovery_json, "discovery")
-    node_code, node_out, _ = run_node_validator("output", invalid_discovery_json, "discovery")
+def test_parity_invalid_discovery(python_validator, node_validator, invalid_discovery_json):
+    py_code, py_out, _ = python_validator.run("output", invalid_discovery_json, "discovery")
+    node_code, node_out, _ = node_validator.run("output", invalid_discovery_json, "discovery")
     
     assert py_code == 1
     assert node_code == 1
@@ -110,12 +156,12 @@ def test_parity_invalid_discovery(invalid_discovery_json):
     assert "Invalid" in node_out
 
 @pytest.mark.skipif(not NODE_AVAILABLE, reason="Node.js not available")
-def test_parity_protocol_schema():
+def test_parity_protocol_schema(python_validator, node_validator):
     # Use the actual protocol file
     protocol_path = ROOT_DIR / "rup-protocol.yaml"
     
-    py_code, _, _ = run_python_validator("protocol", protocol_path)
-    node_code, _, _ = run_node_validator("protocol", protocol_path)
+    py_code, _, _ = python_validator.run("protocol", protocol_path)
+    node_code, _, _ = node_validator.run("protocol", protocol_path)
     
     # Both should pass or both should fail (hopefully pass)
     assert py_code == node_code
@@ -197,9 +243,9 @@ def edge_case_yaml(tmp_path):
     return proto_path
 
 @pytest.mark.skipif(not NODE_AVAILABLE, reason="Node.js not available")
-def test_parity_yaml_anchors(edge_case_yaml):
-    py_code, py_out, _ = run_python_validator("protocol", edge_case_yaml)
-    node_code, node_out, _ = run_node_validator("protocol", edge_case_yaml)
+def test_parity_yaml_anchors(python_validator, node_validator, edge_case_yaml):
+    py_code, py_out, _ = python_validator.run("protocol", edge_case_yaml)
+    node_code, node_out, _ = node_validator.run("protocol", edge_case_yaml)
     
     if py_code != 0 or node_code != 0:
         print(f"Python Out: {py_out}")
@@ -210,7 +256,7 @@ def test_parity_yaml_anchors(edge_case_yaml):
 
 
 @pytest.mark.skipif(not NODE_AVAILABLE, reason="Node.js not available")
-def test_parity_schema_version_mismatch(tmp_path):
+def test_parity_schema_version_mismatch(python_validator, node_validator, tmp_path):
     protocol_content = """
     schema_version: "1.0.0"
     protocol_version: "3.0.0"
@@ -227,8 +273,8 @@ def test_parity_schema_version_mismatch(tmp_path):
     with open(path, "w") as f:
         f.write(protocol_content)
         
-    py_code, py_out, _ = run_python_validator("protocol", path)
-    node_code, node_out, _ = run_node_validator("protocol", path)
+    py_code, py_out, _ = python_validator.run("protocol", path)
+    node_code, node_out, _ = node_validator.run("protocol", path)
     
     assert py_code == 1
     assert node_code == 1
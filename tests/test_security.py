@@ -32,3 +32,19 @@ def test_yaml_alias_limit_blocks_billion_laughs(tmp_path):
     assert result.returncode == 1
     combined = result.stdout + result.stderr
     assert "YAML aliases exceed limit" in combined
+
+
+def test_deeply_nested_json_is_rejected_without_crashing(tmp_path):
+    # Deep nesting crashed orjson releases before 3.9.15 (CVE-2024-27454).
+    path = tmp_path / "deep_plan.json"
+    path.write_text("[" * 200000 + "]" * 200000, encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "output", str(path), "plan"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+    )
+
+    assert result.returncode == 1
+    assert "recursion" in result.stdout
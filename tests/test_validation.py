@@ -1,3 +1,5 @@
+import json
+import multiprocessing
 import subprocess
 import pytest
 import sys
@@ -31,6 +33,19 @@ def test_validate_protocol_execution():
     assert "Valid" in result.stdout or "Valid" in result.stderr
 
 
+def test_validate_protocol_as_module():
+    """Run the validator with ``python -m`` from the repo root."""
+    result = subprocess.run(
+        [sys.executable, "-m", "validators.validate_rup", "protocol", str(PROTOCOL_FILE)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR
+    )
+
+    assert result.returncode == 0, f"Validation failed: {result.stdout}{result.stderr}"
+    assert "Valid" in result.stdout
+
+
 def test_validate_all_fails_on_malformed_yaml(tmp_path):
     """Test that the 'all' command returns exit code 1 for malformed YAML."""
     # Create a malformed YAML file
@@ -47,6 +62,26 @@ def test_validate_all_fails_on_malformed_yaml(tmp_path):
     assert result.returncode == 1, f"Expected exit code 1 for malformed YAML, got {result.returncode}"
 
 
+def test_validate_all_large_directory_in_parallel(tmp_path):
+    """Test that 'all' reports every file when validating in worker processes."""
+    example = (ROOT_DIR / "examples" / "plan_output.json").read_text(encoding="utf-8")
+    for i in range(40):  # above PARALLEL_THRESHOLD
+        (tmp_path / f"plan_{i}.json").write_text(example, encoding="utf-8")
+    (tmp_path / "plan_broken.json").write_text("{not json", encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, "validators/validate_rup.py", "all", str(tmp_path)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR
+    )
+
+    assert result.returncode == 1
+    assert "Could not validate" in result.stdout
+    assert "Total: 40 files" in result.stdout
+    assert "Parse errors: 1" in result.stdout
+
+
 def test_validate_examples_discovery():
     """Run the validation script against the discovery example."""
     example_file = ROOT_DIR / "examples" / "discovery_output.json"
@@ -60,3 +95,170 @@ def test_validate_examples_discovery():
     )
     
     assert result.returncode == 0, f"Discovery example validation failed: {result.stderr}"
+
+
+def test_serve_survives_invalid_requests():
+    """Test that 'serve' answers bad requests with code 2 and keeps serving."""
+    requests = [
+        {"cmd": "all"},
+        {"cmd": "protocol", "path": 5},
+        {"cmd": "protocol", "path": str(PROTOCOL_FILE)},
+    ]
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "serve"],
+        input="".join(json.dumps(request) + "\n" for request in requests),
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 0, result.stderr
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [response["code"] for response in responses] == [2, 2, 0]
+    assert "Invalid request" in responses[0]["stdout"]
+
+
+def _write_mismatched_protocol(tmp_path):
+    """Write a protocol with a wrong schema_version and an unknown key."""
+    text = PROTOCOL_FILE.read_text(encoding="utf-8")
+    text = text.replace('schema_version: "3.0.0"', 'schema_version: "2.0.0"', 1)
+    path = tmp_path / "mismatched_protocol.yaml"
+    path.write_text(text + "not_a_protocol_key: true\n", encoding="utf-8")
+    return path
+
+
+def test_validate_protocol_reports_version_mismatch_alone(tmp_path):
+    """Test that a schema_version mismatch is the only error reported by default."""
+    path = _write_mismatched_protocol(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "protocol", str(path)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1
+    assert "Found 1 error(s)" in result.stdout
+    assert "Schema version mismatch. Expected 3.0.0, got 2.0.0" in result.stdout
+    assert "not_a_protocol_key" not in result.stdout
+
+
+def test_validate_protocol_full_errors(tmp_path):
+    """Test that --full-errors reports the mismatch and the schema errors."""
+    path = _write_mismatched_protocol(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "--full-errors", "protocol", str(path)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1
+    assert "Found 1 error(s)" not in result.stdout
+    assert "Schema version mismatch. Expected 3.0.0, got 2.0.0" in result.stdout
+    assert "not_a_protocol_key" in result.stdout
+
+
+def _write_plan_with_many_errors(tmp_path):
+    """Write a plan output whose 12 empty backlog items each miss 3 required keys."""
+    plan = json.loads((ROOT_DIR / "examples" / "plan_output.json").read_text(encoding="utf-8"))
+    plan["backlog"] = [{} for _ in range(12)]
+    path = tmp_path / "plan_many_errors.json"
+    path.write_text(json.dumps(plan), encoding="utf-8")
+    return path
+
+
+def test_validate_output_truncates_errors(tmp_path):
+    """Test that only the first 10 errors are shown without --verbose."""
+    path = _write_plan_with_many_errors(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "output", str(path), "plan"],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1
+    assert "Found more than 10 errors:" in result.stdout
+    assert result.stdout.count("Message:") == 10
+    assert "... and more errors (use --verbose to see all)" in result.stdout
+
+
+def test_validate_output_verbose_shows_all_errors(tmp_path):
+    """Test that --verbose shows and counts every error."""
+    path = _write_plan_with_many_errors(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "--verbose", "output", str(path), "plan"],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1
+    assert "Found 36 error(s):" in result.stdout
+    assert result.stdout.count("Message:") == 36
+    assert "more errors" not in result.stdout
+
+
+# Runs ``all`` with one file killing its worker process, as a segfault in a C
+# extension would. Workers look the patched function up in ``__main__``.
+CRASHING_WORKER_DRIVER = """
+import os, sys
+sys.path.insert(0, sys.argv[1])
+import validate_rup
+
+validate_one = validate_rup._validate_one
+
+def crash_on_marked_file(file_path, *args, **kwargs):
+    if file_path.name == "plan_crash.json":
+        os._exit(1)
+    return validate_one(file_path, *args, **kwargs)
+
+validate_rup._validate_one = crash_on_marked_file
+sys.argv = ["validate_rup.py", "all", sys.argv[2]]
+sys.exit(validate_rup.main())
+"""
+
+
+def test_validate_all_reports_files_lost_to_a_crashed_worker(tmp_path):
+    """Test that 'all' names unvalidated files when a worker process dies."""
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("workers only inherit the patched function when forked")
+
+    example = (ROOT_DIR / "examples" / "plan_output.json").read_text(encoding="utf-8")
+    for i in range(40):  # above PARALLEL_THRESHOLD
+        (tmp_path / f"plan_{i:02}.json").write_text(example, encoding="utf-8")
+    (tmp_path / "plan_crash.json").write_text(example, encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, "-c", CRASHING_WORKER_DRIVER, str(VALIDATOR_SCRIPT.parent), str(tmp_path)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1, result.stderr
+    assert "Traceback" not in result.stderr
+    assert "plan_crash.json: not validated, a validator worker process crashed" in result.stdout
+
+
+def test_validate_protocol_reports_unquoted_yaml_date(tmp_path):
+    """Test that a YAML date, which is not JSON, is reported as a type error."""
+    text = PROTOCOL_FILE.read_text(encoding="utf-8")
+    path = tmp_path / "dated_protocol.yaml"
+    path.write_text(text.replace('date: "2026-01-22"', 'date: 2026-01-22', 1), encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(VALIDATOR_SCRIPT), "protocol", str(path)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8"
+    )
+
+    assert result.returncode == 1, result.stdout
+    assert "metadata.changelog.0.date" in result.stdout
+    assert "datetime.date(2026, 1, 22) is not of type 'string'" in result.stdout
@@ -0,0 +1,175 @@
+import datetime
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / "validators"))
+
+import _validator  # noqa: E402
+
+
+needs_fastjsonschema = pytest.mark.skipif(
+    not _validator._HAVE_FASTJSONSCHEMA, reason="fastjsonschema not installed"
+)
+needs_posix_permissions = pytest.mark.skipif(
+    not hasattr(os, "getuid"), reason="POSIX ownership and modes only"
+)
+needs_jsonschema_rs = pytest.mark.skipif(
+    not _validator._HAVE_JSONSCHEMA_RS, reason="jsonschema-rs not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep generated fastjsonschema code out of the user's cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("RUP_CACHE_DIR", str(path))
+    return path
+
+
+# Each keyword is one fastjsonschema (drafts 4/6/7) ignores.
+POST_DRAFT7_CASES = [
+    (
+        {"dependentRequired": {"a": ["b"]}},
+        {"a": 1},
+    ),
+    (
+        {"properties": {"a": {}}, "unevaluatedProperties": False},
+        {"a": 1, "b": 2},
+    ),
+    (
+        {"$defs": {"obj": {"type": "object"}}, "$ref": "#/$defs/obj", "required": ["a"]},
+        {},
+    ),
+]
+
+
+@pytest.mark.parametrize("schema, instance", POST_DRAFT7_CASES)
+def test_python_validator_applies_post_draft7_keywords(schema, instance):
+    validator = _validator.PythonValidator(schema)
+
+    assert validator._fast is None
+    assert not validator.is_valid(instance)
+    assert len(list(validator.iter_errors(instance))) == 1
+
+
+@needs_fastjsonschema
+def test_python_validator_screens_draft7_schemas():
+    validator = _validator.PythonValidator({"type": "object", "required": ["a"]})
+
+    assert validator._fast is not None
+    assert validator.is_valid({"a": 1})
+    assert not validator.is_valid({})
+
+
+CACHE_SCHEMA = {"type": "object", "required": ["a"]}
+
+
+@pytest.fixture
+def python_backend(monkeypatch):
+    """Make ``compile`` pick the jsonschema + fastjsonschema backend."""
+    monkeypatch.setattr(_validator, "_HAVE_JSONSCHEMA_RS", False)
+
+
+@needs_fastjsonschema
+@needs_posix_permissions
+def test_fast_code_cache_miss_writes_private_files(python_backend, cache_dir):
+    validator = _validator.compile(CACHE_SCHEMA)
+
+    assert isinstance(validator, _validator.PythonValidator)
+    assert validator.is_valid({"a": 1})
+    assert not validator.is_valid({})
+    (module,) = cache_dir.glob("*.py")
+    (bytecode,) = cache_dir.glob("__pycache__/*.pyc")
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE(module.stat().st_mode) == 0o600
+    assert stat.S_IMODE(bytecode.stat().st_mode) == 0o600
+
+
+@needs_fastjsonschema
+def test_fast_code_cache_hit_skips_code_generation(python_backend, cache_dir, monkeypatch):
+    import fastjsonschema
+
+    _validator.compile(CACHE_SCHEMA)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached code was regenerated")
+
+    monkeypatch.setattr(fastjsonschema, "compile_to_code", fail)
+    validator = _validator.compile(CACHE_SCHEMA)
+
+    assert validator._fast is not None
+    assert not validator.is_valid({})
+
+
+@needs_fastjsonschema
+def test_fast_code_unwritable_cache_dir_compiles_in_memory(python_backend, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv("RUP_CACHE_DIR", str(blocker / "cache"))
+
+    validator = _validator.compile(CACHE_SCHEMA)
+
+    assert validator._fast is not None
+    assert validator.is_valid({"a": 1})
+    assert not validator.is_valid({})
+
+
+@needs_fastjsonschema
+@needs_posix_permissions
+def test_fast_code_not_imported_from_writable_cache(python_backend, cache_dir):
+    _validator.compile(CACHE_SCHEMA)
+    (module,) = cache_dir.glob("*.py")
+    sentinel = cache_dir.parent / "imported"
+    # Stand-in for code planted by another user.
+    module.write_text(f"open({str(sentinel)!r}, 'w').close()\n", encoding="utf-8")
+    module.chmod(0o666)
+
+    validator = _validator.compile(CACHE_SCHEMA)
+
+    assert not sentinel.exists()
+    assert validator._fast is not None  # compiled in memory instead
+    assert not validator.is_valid({})
+
+STRING_VALUES_SCHEMA = {"type": "object", "additionalProperties": {"type": "string"}}
+
+
+@needs_jsonschema_rs
+def test_rust_validator_errors_are_schema_errors():
+    validator = _validator.RustValidator({"type": "object", "required": ["a"]})
+
+    (error,) = validator.iter_errors({})
+
+    assert isinstance(error, _validator.SchemaError)
+    assert error.instance_path == ()
+    assert error.schema_path == ("required",)
+    assert error.validator == "required"
+    assert error.validator_value == ["a"]
+
+
+@needs_jsonschema_rs
+def test_rust_validator_falls_back_for_yaml_dates():
+    # A YAML timestamp loads as datetime.date, which jsonschema-rs rejects.
+    validator = _validator.RustValidator(STRING_VALUES_SCHEMA)
+    instance = {"when": datetime.date(2026, 1, 22)}
+
+    assert not validator.is_valid(instance)
+    (error,) = validator.iter_errors(instance)
+    assert error.message == "datetime.date(2026, 1, 22) is not of type 'string'"
+    assert error.instance_path == ("when",)
+    assert validator._fallback is not None
+
+
+@needs_jsonschema_rs
+def test_rust_validator_falls_back_for_non_string_keys():
+    validator = _validator.RustValidator(STRING_VALUES_SCHEMA)
+
+    assert validator.is_valid({1: "one"})
+    assert not validator.is_valid({1: 1})
+    (error,) = validator.iter_errors({1: 1})
+    assert error.instance_path == (1,)
@@ -59,4 +59,19 @@ describe('RUP Validation', () => {
             fs.unlinkSync(tmpFile);
         }
     });
+
+    it('should answer JSON-line requests in serve mode', () => {
+        const requests = [
+            { cmd: 'protocol', path: PROTOCOL_FILE },
+            { cmd: 'bogus' }
+        ].map(request => JSON.stringify(request)).join('\n') + '\n';
+
+        const output = execSync(`node ${VALIDATOR_SCRIPT} serve`, { encoding: 'utf8', input: requests });
+        const responses = output.trim().split('\n').map(line => JSON.parse(line));
+
+        expect(responses).toHaveLength(2);
+        expect(responses[0].code).toBe(0);
+        expect(responses[0].stdout).toContain('Valid');
+        expect(responses[1].code).toBe(2);
+    });
 });
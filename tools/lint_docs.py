@@ -6,16 +6,43 @@ Rules:
 - No tabs
 - No trailing whitespace
 - Files must end with a newline
-- YAML must parse via PyYAML (safe_load)
+- YAML must parse via PyYAML (safe loader, libyaml-backed when available)
+
+Usage:
+    python tools/lint_docs.py                      # all tracked files
+    python tools/lint_docs.py --changed-only       # files changed vs origin/main
+    python tools/lint_docs.py --changed-only main  # files changed vs another ref
 """
 
 from __future__ import annotations
 
+import argparse
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# libyaml composes nodes recursively in C and overflows the stack on deeply
+# nested flow collections (about 100k levels). Nesting depth is bounded by the
+# bracket count, so documents with more brackets than this use the pure-Python
+# loader, which reports a RecursionError instead of crashing.
+MAX_C_LOADER_BRACKETS = 10_000
+
+LINT_SUFFIXES = (".md", ".yaml", ".yml")
+
+DEFAULT_BASE_REF = "origin/main"
+
+# Below this many files, process start-up costs more than it saves.
+PARALLEL_THRESHOLD = 32
+
 EXCLUDE_PREFIXES = (
     "legacy/",
     "runs/",
@@ -24,55 +51,127 @@ EXCLUDE_PREFIXES = (
 )
 
 
+def lint_pathspecs() -> list[str]:
+    # Let git's pathspec engine do the suffix/prefix filtering.
+    pathspecs = [f":(icase)*{suffix}" for suffix in LINT_SUFFIXES]
+    pathspecs += [f":(exclude){prefix}*" for prefix in EXCLUDE_PREFIXES]
+    return pathspecs
+
+
+def _git_paths(args: list[str], stderr: int | None = None) -> list[Path]:
+    output = subprocess.check_output(["git", *args, "-z", "--", *lint_pathspecs()], stderr=stderr)
+    return [Path(os.fsdecode(name)) for name in output.split(b"\0") if name]
+
+
 def list_tracked_files() -> list[Path]:
-    output = subprocess.check_output(["git", "ls-files"], text=True)
-    return [Path(line.strip()) for line in output.splitlines() if line.strip()]
+    return _git_paths(["ls-files"])
 
 
-def is_excluded(path: Path) -> bool:
-    path_str = path.as_posix()
-    return path_str.startswith(EXCLUDE_PREFIXES)
+def list_changed_files(base_ref: str) -> list[Path]:
+    """Files added, copied, modified or renamed on HEAD since it forked from base_ref."""
+    # git's own message is dropped; main() reports a missing base_ref itself.
+    return _git_paths(
+        ["diff", "--name-only", "--relative", "--diff-filter=ACMR", f"{base_ref}...HEAD"],
+        stderr=subprocess.DEVNULL,
+    )
 
 
-def check_text_rules(path: Path, content: str) -> list[str]:
+# ASCII byte sequences that only occur in files breaking the tab/trailing-
+# whitespace rules. ASCII files containing none of them skip the per-line scan
+# entirely; any non-ASCII file is scanned, since Unicode has more whitespace.
+_TEXT_RULE_MARKERS = (b"\t", b" \n", b" \r", b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+
+
+def check_text_rules(path: Path, content: bytes) -> list[str]:
     errors: list[str] = []
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if "\t" in line:
-            errors.append(f"{path}:{idx}: contains tab character")
-        if line.rstrip("\n") != line.rstrip():
-            errors.append(f"{path}:{idx}: trailing whitespace")
-    if content and not content.endswith("\n"):
+    if (
+        content.endswith(b" ")
+        or not content.isascii()
+        or any(marker in content for marker in _TEXT_RULE_MARKERS)
+    ):
+        # Only flagged files are decoded, so line numbers and the whitespace
+        # rstrip() removes follow str semantics (\x0b and \x0c end lines).
+        text = content.decode("utf-8", errors="ignore")
+        for idx, line in enumerate(text.splitlines(), start=1):
+            if "\t" in line:
+                errors.append(f"{path}:{idx}: contains tab character")
+            if line != line.rstrip():
+                errors.append(f"{path}:{idx}: trailing whitespace")
+    if content and not content.endswith(b"\n"):
         errors.append(f"{path}: missing trailing newline at EOF")
     return errors
 
 
-def lint_yaml(path: Path, content: str) -> list[str]:
+def lint_yaml(path: Path, content: bytes, c_loader: bool = True) -> list[str]:
     errors = check_text_rules(path, content)
+    if c_loader and content.count(b"[") + content.count(b"{") <= MAX_C_LOADER_BRACKETS:
+        loader = SafeLoader
+    else:
+        loader = yaml.SafeLoader
     try:
-        yaml.safe_load(content)
+        # The loader takes the raw bytes and detects the encoding itself.
+        yaml.load(content, Loader=loader)
     except Exception as exc:  # noqa: BLE001 - explicit for linting output
         errors.append(f"{path}: YAML parse error: {exc}")
     return errors
 
 
-def lint_markdown(path: Path, content: str) -> list[str]:
+def lint_markdown(path: Path, content: bytes) -> list[str]:
     return check_text_rules(path, content)
 
 
-def main() -> int:
+def lint_file(path: Path, c_loader: bool = True) -> list[str]:
+    try:
+        content = path.read_bytes()
+    except (FileNotFoundError, IsADirectoryError):
+        # Deleted in the working tree, or a submodule gitlink.
+        return []
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        return lint_yaml(path, content, c_loader)
+    return lint_markdown(path, content)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Minimal Markdown/YAML linter.")
+    parser.add_argument(
+        "--changed-only",
+        nargs="?",
+        const=DEFAULT_BASE_REF,
+        metavar="BASE_REF",
+        help=f"Only lint files changed since BASE_REF (default: {DEFAULT_BASE_REF})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     errors: list[str] = []
 
-    for path in list_tracked_files():
-        if is_excluded(path) or not path.exists() or path.is_dir():
-            continue
-        suffix = path.suffix.lower()
-        if suffix not in {".md", ".yaml", ".yml"}:
-            continue
-        content = path.read_text(encoding="utf-8", errors="ignore")
-        if suffix in {".yaml", ".yml"}:
-            errors.extend(lint_yaml(path, content))
-        else:
-            errors.extend(lint_markdown(path, content))
+    if args.changed_only:
+        try:
+            files = list_changed_files(args.changed_only)
+        except subprocess.CalledProcessError:
+            # e.g. a shallow checkout, or a clone without an origin remote.
+            print(f"Error: cannot diff against base ref {args.changed_only!r}; fetch it or pass another ref.")
+            return 2
+    else:
+        files = list_tracked_files()
+    if len(files) > PARALLEL_THRESHOLD:
+        # Linting is independent per file; spread it across CPUs for big trees.
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(lint_file, files, chunksize=16)
+                for file_errors in results:
+                    errors.extend(file_errors)
+        except BrokenProcessPool:
+            # A worker died, e.g. libyaml crashing on some input. Re-lint in
+            # this process without libyaml so the error names the file.
+            errors = []
+            for path in files:
+                errors.extend(lint_file(path, c_loader=False))
+    else:
+        for path in files:
+            errors.extend(lint_file(path))
 
     if errors:
         for error in errors:
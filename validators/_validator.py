@@ -0,0 +1,296 @@
+"""
+Schema validation backends for validate_rup.py.
+
+``compile(schema)`` returns a validator exposing ``is_valid(instance)`` and
+``iter_errors(instance)``. Backends are tried in order: the Rust-backed
+``jsonschema_rs``, then ``fastjsonschema`` generated code (stops at the first
+failure, so ``jsonschema`` still reports the errors; only used for schemas
+without post-draft-7 keywords), then plain ``jsonschema``. Errors from every backend are reported as ``SchemaError``
+tuples so callers never depend on a library-specific error class.
+
+Code generated by fastjsonschema is cached under ``$RUP_CACHE_DIR`` (default
+``~/.cache/rup-validator``), keyed by a SHA-256 of the schema and options. It
+is only imported from a directory private to the current user.
+
+License: CC0-1.0
+"""
+
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import py_compile
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Backends are imported by the first validator that uses them (jsonschema
+# alone takes ~80 ms to import); here they are only probed.
+_HAVE_JSONSCHEMA_RS = importlib.util.find_spec("jsonschema_rs") is not None
+_HAVE_FASTJSONSCHEMA = importlib.util.find_spec("fastjsonschema") is not None
+_HAVE_JSONSCHEMA = importlib.util.find_spec("jsonschema") is not None
+
+if not (_HAVE_JSONSCHEMA or _HAVE_JSONSCHEMA_RS):
+    # jsonschema is only optional when the Rust backend can stand in for it.
+    raise ModuleNotFoundError("No module named 'jsonschema'", name="jsonschema")
+
+
+class SchemaError(NamedTuple):
+    """A backend-neutral validation error."""
+
+    message: str
+    instance_path: Tuple[Any, ...] = ()
+    schema_path: Tuple[Any, ...] = ()
+    validator: Optional[str] = None
+    validator_value: Any = None
+
+
+def _lookup(schema: Any, path: Sequence[Any]) -> Any:
+    """Follow a schema path, returning None when it cannot be walked."""
+    node = schema
+    for part in path:
+        try:
+            node = node[part]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return node
+
+
+def _refuse_remote_ref(uri: str) -> Any:
+    raise ValueError(f"Remote $ref not allowed: {uri}")
+
+
+_FAST_HANDLERS = {"http": _refuse_remote_ref, "https": _refuse_remote_ref}
+# Formats and defaults are disabled to match ``Draft202012Validator``.
+_FAST_OPTIONS = {"use_default": False, "use_formats": False}
+_FAST_ENTRY_RE = re.compile(r"^def (\w+)\(", re.MULTILINE)
+
+
+# Keywords from drafts 2019-09/2020-12 that fastjsonschema (drafts 4/6/7)
+# silently ignores, which would let invalid documents through the screen.
+_POST_DRAFT7_KEYWORDS = frozenset({
+    "$anchor", "$dynamicAnchor", "$dynamicRef", "$recursiveAnchor", "$recursiveRef",
+    "$vocabulary", "dependentRequired", "dependentSchemas", "maxContains",
+    "minContains", "prefixItems", "unevaluatedItems", "unevaluatedProperties",
+})
+# Before 2019-09, keywords next to a $ref are ignored; these carry no constraint.
+_REF_SIBLINGS_IGNORED = frozenset({"$comment", "$defs", "definitions", "description", "title"})
+
+
+def _draft7_compatible(schema: Any) -> bool:
+    """Return whether fastjsonschema validates ``schema`` exactly as 2020-12 would.
+
+    Conservative: every mapping in the schema is checked, including
+    ``properties`` maps and ``const``/``enum`` values, so an unusual property
+    name only costs the screen, never correctness.
+    """
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if not _POST_DRAFT7_KEYWORDS.isdisjoint(node):
+                return False
+            if "$ref" in node and not _REF_SIBLINGS_IGNORED.issuperset(node.keys() - {"$ref"}):
+                return False
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return True
+
+
+def _cache_dir() -> Path:
+    override = os.getenv("RUP_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "rup-validator"
+
+
+def _private_to_user(path: Path) -> bool:
+    """Return whether ``path`` belongs to the current user and is not group- or world-writable."""
+    if not hasattr(os, "getuid"):  # e.g. Windows, where the profile ACLs apply
+        return True
+    st = os.stat(path)
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _require_private(path: Path) -> None:
+    if not _private_to_user(path):
+        raise PermissionError(
+            f"Refusing to import from {path}: not owned by the current user, or writable by others"
+        )
+
+
+def _load_fast_code(schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Import the generated fastjsonschema module, writing it on a cache miss.
+
+    The cached code is executed, so the directory, the module and its
+    bytecode must all belong to the current user and not be group- or
+    world-writable; otherwise ``PermissionError`` is raised.
+    """
+    import fastjsonschema
+
+    fingerprint = json.dumps(
+        [fastjsonschema.VERSION, _FAST_OPTIONS, schema], sort_keys=True, ensure_ascii=False
+    )
+    key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+    cache_dir = _cache_dir()
+    path = cache_dir / f"{key}.py"
+    pyc_path = Path(importlib.util.cache_from_source(str(path)))
+
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _require_private(cache_dir)
+
+    if not path.exists():
+        # fastjsonschema rewrites $refs in place, so never hand it a shared schema.
+        code = fastjsonschema.compile_to_code(
+            copy.deepcopy(schema), handlers=_FAST_HANDLERS, **_FAST_OPTIONS
+        )
+        # The first generated function validates the root schema.
+        entry = _FAST_ENTRY_RE.search(code)
+        if entry is None:
+            raise ValueError("Generated fastjsonschema code has no entry point")
+        code += f"\n\nvalidate = {entry.group(1)}\n"
+        # Write-then-rename so concurrent processes never import a partial file.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(code)
+        os.replace(tmp_path, path)
+
+    # Compiling the generated source dominates load time, and imports only
+    # write bytecode when allowed to, so write it explicitly.
+    if not pyc_path.exists():
+        pyc_path.parent.mkdir(mode=0o700, exist_ok=True)
+        py_compile.compile(str(path), cfile=str(pyc_path), doraise=True)
+
+    for cached in (path, pyc_path.parent, pyc_path):
+        _require_private(cached)
+
+    spec = importlib.util.spec_from_file_location(f"_rup_fast_{key[:16]}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def _compile_fast(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Return a fastjsonschema pass/fail function, or None if unavailable.
+
+    A fastjsonschema pass is trusted as final, so schemas it would check more
+    loosely than ``Draft202012Validator`` get no screen.
+    """
+    if not _HAVE_FASTJSONSCHEMA or not _draft7_compatible(schema):
+        return None
+    import fastjsonschema
+
+    try:
+        return _load_fast_code(schema)
+    except Exception:  # noqa: BLE001 - e.g. read-only cache dir; compile in memory
+        pass
+    try:
+        return fastjsonschema.compile(
+            copy.deepcopy(schema), handlers=_FAST_HANDLERS, **_FAST_OPTIONS
+        )
+    except Exception:  # noqa: BLE001 - any compile failure falls back to jsonschema
+        return None
+
+
+class PythonValidator:
+    """``jsonschema`` validator, screened by fastjsonschema when installed."""
+
+    backend = "jsonschema"
+
+    def __init__(self, schema: Dict[str, Any]):
+        from jsonschema import Draft202012Validator
+
+        self._validator = Draft202012Validator(schema)
+        self._fast = _compile_fast(schema)
+        if self._fast is not None:
+            from fastjsonschema import JsonSchemaValueException
+
+            self._fast_error = JsonSchemaValueException
+
+    def _fast_accepts(self, instance: Any) -> bool:
+        if self._fast is None:
+            return False
+        try:
+            self._fast(instance)
+        except self._fast_error:
+            return False  # jsonschema stays the authority for failures
+        return True
+
+    def is_valid(self, instance: Any) -> bool:
+        return self._fast_accepts(instance) or self._validator.is_valid(instance)
+
+    def iter_errors(self, instance: Any) -> Iterator[SchemaError]:
+        if self._fast_accepts(instance):
+            return
+        for error in self._validator.iter_errors(instance):
+            yield SchemaError(
+                error.message,
+                tuple(error.absolute_path),
+                tuple(error.schema_path),
+                error.validator,
+                error.validator_value,
+            )
+
+
+class RustValidator:
+    """``jsonschema_rs`` validator with a ``jsonschema`` fallback for non-JSON data."""
+
+    backend = "jsonschema-rs"
+
+    def __init__(self, schema: Dict[str, Any]):
+        import jsonschema_rs
+
+        self._schema = schema
+        self._validator = jsonschema_rs.validator_for(schema, offline=True)
+        self._fallback: Optional[PythonValidator] = None
+
+    def _python(self) -> PythonValidator:
+        # YAML can produce values JSON cannot hold (dates, non-string keys);
+        # jsonschema_rs rejects those with ValueError, jsonschema reports them.
+        if self._fallback is None:
+            if not _HAVE_JSONSCHEMA:
+                raise ValueError("Document contains non-JSON values; install jsonschema to validate it")
+            self._fallback = PythonValidator(self._schema)
+        return self._fallback
+
+    def is_valid(self, instance: Any) -> bool:
+        try:
+            return self._validator.is_valid(instance)
+        except ValueError:
+            return self._python().is_valid(instance)
+
+    def iter_errors(self, instance: Any) -> Iterator[SchemaError]:
+        try:
+            errors = list(self._validator.iter_errors(instance))
+        except ValueError:
+            yield from self._python().iter_errors(instance)
+            return
+        for error in errors:
+            schema_path = tuple(error.schema_path)
+            keyword = schema_path[-1] if schema_path and isinstance(schema_path[-1], str) else None
+            yield SchemaError(
+                error.message,
+                tuple(error.instance_path),
+                schema_path,
+                keyword,
+                _lookup(self._schema, schema_path),
+            )
+
+
+Validator = Union[RustValidator, PythonValidator]
+
+
+def compile(schema: Dict[str, Any]) -> Validator:
+    """Compile a schema with the fastest available backend (see module docstring)."""
+    if _HAVE_JSONSCHEMA_RS:
+        try:
+            return RustValidator(schema)
+        except ValueError:
+            # e.g. a construct the Rust engine rejects; jsonschema may still cope.
+            if not _HAVE_JSONSCHEMA:
+                raise
+    return PythonValidator(schema)
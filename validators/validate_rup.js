@@ -8,6 +8,7 @@
  *   node validate_rup.js protocol <protocol.yaml>
  *   node validate_rup.js output <output.json> <discovery|plan|execution|verification>
  *   node validate_rup.js all <directory>
+ *   node validate_rup.js serve
  *
  * Requirements:
  *   npm install ajv ajv-formats js-yaml glob
@@ -18,6 +19,8 @@
 
 const fs = require('fs');
 const path = require('path');
+const readline = require('readline');
+const util = require('util');
 
 function envInt(name, defaultValue) {
     const raw = process.env[name];
@@ -61,6 +64,9 @@ const colors = {
     reset: '\x1b[0m'
 };
 
+// Set while serve() captures console.log, whose output never reaches the terminal.
+let capturingOutput = false;
+
 /**
  * Add ANSI color codes to text if the terminal supports it.
  * @param {string} text - The text to colorize.
@@ -68,7 +74,7 @@ const colors = {
  * @returns {string} Colorized text or the original text if not a TTY.
  */
 function colorize(text, color) {
-    if (process.stdout.isTTY) {
+    if (process.stdout.isTTY && !capturingOutput) {
         return `${colors[color]}${text}${colors.reset}`;
     }
     return text;
@@ -90,9 +96,13 @@ function printInfo(message) {
     console.log(`${colorize('ℹ', 'blue')} ${message}`);
 }
 
+// Parsed schemas keyed by resolved path; an entry is reused until the file's mtime changes.
+const schemaCache = new Map();
+
 // Load schema
 /**
  * Load the RUP JSON Schema from the specified path or default location.
+ * The parsed schema is cached per path, so treat it as read-only.
  * @param {string|null} schemaPath - Path to the schema file, or null for default.
  * @returns {Object} Parsed JSON schema object.
  * @throws {Error} If the schema file is not found.
@@ -106,7 +116,16 @@ function loadSchema(schemaPath) {
         throw new Error(`Schema not found: ${schemaPath}`);
     }
 
-    return JSON.parse(readFileWithLimit(schemaPath));
+    const resolved = path.resolve(schemaPath);
+    const { mtimeMs } = fs.statSync(resolved);
+    const cached = schemaCache.get(resolved);
+    if (cached && cached.mtimeMs === mtimeMs) {
+        return cached.schema;
+    }
+
+    const schema = JSON.parse(readFileWithLimit(resolved));
+    schemaCache.set(resolved, { mtimeMs, schema });
+    return schema;
 }
 
 // Load YAML file
@@ -169,6 +188,29 @@ function formatError(error, indent = 0) {
     return lines.join('\n');
 }
 
+// Errors printed per file
+const ERROR_DISPLAY_LIMIT = 10;
+
+/**
+ * Print the error summary for an invalid file.
+ * AJV reports every error (allErrors), so the exact count is always known.
+ * @param {Object[]} errors - AJV validation error objects.
+ */
+function printErrors(errors) {
+    console.log(`  Found ${errors.length} error(s):`);
+
+    errors.slice(0, ERROR_DISPLAY_LIMIT).forEach(error => {
+        console.log(formatError(error, 1));
+    });
+
+    if (errors.length > ERROR_DISPLAY_LIMIT) {
+        console.log(`  ... and ${errors.length - ERROR_DISPLAY_LIMIT} more errors`);
+    }
+}
+
+// Compiled validators per cached schema object, keyed by definition name ('' for the root).
+const validatorCache = new WeakMap();
+
 // Create AJV validator
 /**
  * Create an AJV validator instance configured for the RUP schema.
@@ -186,6 +228,32 @@ function createValidator(schema) {
     return ajv.compile(schema);
 }
 
+/**
+ * Return a compiled validator for the schema, or for one of its $defs.
+ * Compilation is the expensive step, so each (schema, defName) pair is
+ * compiled once; the schema must not be mutated afterwards.
+ * @param {Object} schema - Root JSON Schema object (as returned by loadSchema).
+ * @param {string|null} defName - Definition under $defs, or null for the root.
+ * @returns {Function} Compiled AJV validate function.
+ */
+function getValidator(schema, defName = null) {
+    let perSchema = validatorCache.get(schema);
+    if (!perSchema) {
+        perSchema = new Map();
+        validatorCache.set(schema, perSchema);
+    }
+
+    const key = defName || '';
+    let validate = perSchema.get(key);
+    if (!validate) {
+        // Create sub-schema with definitions
+        const target = defName ? { ...schema.$defs[defName], $defs: schema.$defs } : schema;
+        validate = createValidator(target);
+        perSchema.set(key, validate);
+    }
+    return validate;
+}
+
 // Validate protocol
 /**
  * Validate a RUP protocol YAML file against the schema.
@@ -216,7 +284,7 @@ function validateProtocol(protocolPath, schemaPath) {
              return { valid: false, errors: [{ message: "Schema version mismatch" }] };
         }
 
-        const validate = createValidator(schema);
+        const validate = getValidator(schema);
         const valid = validate(protocol);
 
         if (valid) {
@@ -224,15 +292,7 @@ function validateProtocol(protocolPath, schemaPath) {
             return { valid: true, errors: [] };
         } else {
             console.log(`${colorize('✗', 'red')} ${colorize(protocolPath, 'bold')}: ${colorize('Invalid', 'red')}`);
-            console.log(`  Found ${validate.errors.length} error(s):`);
-
-            validate.errors.slice(0, 10).forEach(error => {
-                console.log(formatError(error, 1));
-            });
-
-            if (validate.errors.length > 10) {
-                console.log(`  ... and ${validate.errors.length - 10} more errors`);
-            }
+            printErrors(validate.errors);
 
             return { valid: false, errors: validate.errors };
         }
@@ -275,13 +335,7 @@ function validateOutput(outputPath, outputType, schemaPath) {
             return { valid: false, errors: [] };
         }
 
-        // Create sub-schema with definitions
-        const subSchema = {
-            ...schema.$defs[defName],
-            $defs: schema.$defs
-        };
-
-        const validate = createValidator(subSchema);
+        const validate = getValidator(schema, defName);
         const valid = validate(output);
 
         if (valid) {
@@ -289,15 +343,7 @@ function validateOutput(outputPath, outputType, schemaPath) {
             return { valid: true, errors: [] };
         } else {
             console.log(`${colorize('✗', 'red')} ${colorize(outputPath, 'bold')}: ${colorize('Invalid', 'red')}`);
-            console.log(`  Found ${validate.errors.length} error(s):`);
-
-            validate.errors.slice(0, 10).forEach(error => {
-                console.log(formatError(error, 1));
-            });
-
-            if (validate.errors.length > 10) {
-                console.log(`  ... and ${validate.errors.length - 10} more errors`);
-            }
+            printErrors(validate.errors);
 
             return { valid: false, errors: validate.errors };
         }
@@ -463,6 +509,50 @@ function generateSample(outputType, outputPath) {
     return true;
 }
 
+// Serve validation requests
+/**
+ * Answer JSON-line validation requests read from stdin.
+ * Each request looks like {"cmd": "output", "path": "discovery.json", "type": "discovery"}
+ * and is answered with one {"code": <exit code>, "stdout": <output>} line, so a
+ * single long-lived process can validate many files.
+ * @param {string|null} schemaPath - Path to the schema file, or null for default.
+ */
+function serve(schemaPath) {
+    const handlers = {
+        protocol: (request) => validateProtocol(request.path, schemaPath).valid,
+        output: (request) => validateOutput(request.path, request.type, schemaPath).valid,
+        all: (request) => validateAll(request.path, schemaPath).valid
+    };
+
+    const rl = readline.createInterface({ input: process.stdin, terminal: false });
+    rl.on('line', (line) => {
+        if (!line.trim()) return;
+
+        const captured = [];
+        const originalLog = console.log;
+        console.log = (...parts) => captured.push(util.format(...parts) + '\n');
+        capturingOutput = true;
+
+        let code;
+        try {
+            const request = JSON.parse(line);
+            const handler = handlers[request.cmd];
+            if (!handler) {
+                throw new Error(`Unknown command: ${request.cmd}`);
+            }
+            code = handler(request) ? 0 : 1;
+        } catch (e) {
+            captured.push(`Error: Invalid request: ${e.message}\n`);
+            code = 2;
+        } finally {
+            console.log = originalLog;
+            capturingOutput = false;
+        }
+
+        process.stdout.write(JSON.stringify({ code, stdout: captured.join('') }) + '\n');
+    });
+}
+
 // Print usage
 function printUsage() {
     console.log(`
@@ -473,6 +563,7 @@ ${colorize('Usage:', 'bold')}
     node validate_rup.js output <file.json> <type>
     node validate_rup.js all <directory>
     node validate_rup.js sample <type> [output.json]
+    node validate_rup.js serve
     node validate_rup.js help
 
 ${colorize('Output Types:', 'bold')}
@@ -562,6 +653,10 @@ function main() {
             process.exit(sampleResult ? 0 : 1);
             break;
 
+        case 'serve':
+            serve(schemaPath);
+            break;
+
         case 'help':
         case '--help':
         case '-h':
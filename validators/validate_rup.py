@@ -8,25 +8,47 @@ Usage:
     python validate_rup.py protocol <protocol.yaml>
     python validate_rup.py output <output.json> <discovery|plan|execution|verification>
     python validate_rup.py all <directory>
+    python validate_rup.py serve
 
 Requirements:
-    pip install jsonschema pyyaml
+    pip install jsonschema pyyaml  # PyYAML wheels bundle libyaml, used when present
+    pip install jsonschema-rs    # optional, compiled validator (preferred)
+    pip install fastjsonschema  # optional, speeds up jsonschema on valid files
+    pip install "orjson>=3.9.15"  # optional, faster JSON parsing
 
 Author: Faye Håkansdotter
 License: CC0-1.0
 """
 
 import argparse
+import contextlib
+import functools
+import importlib.util
+import io
+import itertools
 import json
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Final, Iterable, List, NamedTuple, Optional, Tuple
 
+# _validator sits beside this file; make it importable however this script
+# is run (directly, or as ``python -m validators.validate_rup``).
+_SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+# PyYAML and the schema backends are imported on first use; only probe for
+# them here so a missing dependency still fails early with install advice.
 try:
-    import yaml
-    from jsonschema import Draft202012Validator, ValidationError
+    import _validator
+    from _validator import SchemaError
+    if importlib.util.find_spec("yaml") is None:
+        raise ModuleNotFoundError("No module named 'yaml'", name="yaml")
 except ImportError as e:
+    if e.name not in {"yaml", "jsonschema"}:
+        raise
     print(f"Error: Missing required module: {e.name}")
     print("Install with: pip install jsonschema pyyaml")
     sys.exit(1)
@@ -45,26 +67,78 @@ def _env_int(name: str, default: int) -> int:
 MAX_FILE_BYTES = _env_int("RUP_MAX_FILE_BYTES", 5 * 1024 * 1024)
 MAX_YAML_ALIASES = _env_int("RUP_MAX_YAML_ALIASES", 50)
 
+# ``all`` validates in worker processes above this many files.
+PARALLEL_THRESHOLD = 32
+
+# Errors printed per file unless --verbose.
+ERROR_DISPLAY_LIMIT = 10
+
+# File results ``all`` renders before each write to stdout.
+OUTPUT_BATCH_FILES = 64
+
+# Map output types to schema definitions
+_TYPE_MAP: Final[Dict[str, str]] = {
+    'discovery': 'DiscoveryReport',
+    'plan': 'PlanOutput',
+    'execution': 'ExecutionOutput',
+    'verification': 'VerificationOutput'
+}
+_VALID_TYPES: Final = frozenset(_TYPE_MAP)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> type:
+    """Return the alias-limited YAML loader class, importing PyYAML on first use.
+
+    Importing PyYAML is deferred so commands that never read YAML, such as
+    ``sample``, do not pay for it.
+    """
+    import yaml
+    from yaml.composer import Composer
+    from yaml.constructor import SafeConstructor
+    from yaml.resolver import Resolver
+
+    class _AliasLimitMixin:
+        """Composer hook capping alias expansion to prevent YAML bombs."""
+
+        _alias_count = 0
 
-class LimitedAliasLoader(yaml.SafeLoader):
-    """SafeLoader with alias expansion limits to prevent YAML bombs."""
+        def compose_node(self, parent, index):  # type: ignore[override]
+            if self.check_event(yaml.AliasEvent):
+                self._alias_count += 1
+                if self._alias_count > MAX_YAML_ALIASES:
+                    raise yaml.YAMLError(
+                        f"YAML aliases exceed limit ({MAX_YAML_ALIASES})."
+                    )
+            return super().compose_node(parent, index)
 
-    def __init__(self, stream):
-        super().__init__(stream)
-        self._alias_count = 0
+    class LimitedAliasLoader(_AliasLimitMixin, yaml.SafeLoader):
+        """SafeLoader with alias expansion limits to prevent YAML bombs."""
 
-    def compose_node(self, parent, index):  # type: ignore[override]
-        if self.check_event(yaml.AliasEvent):
-            self._alias_count += 1
-            if self._alias_count > MAX_YAML_ALIASES:
-                raise yaml.YAMLError(
-                    f"YAML aliases exceed limit ({MAX_YAML_ALIASES})."
-                )
-        return super().compose_node(parent, index)
+    try:
+        from yaml.cyaml import CParser
+    except ImportError:  # PyYAML built without libyaml
+        return LimitedAliasLoader
 
+    class CLimitedAliasLoader(_AliasLimitMixin, Composer, CParser, SafeConstructor, Resolver):
+        """LimitedAliasLoader that parses with libyaml.
+
+        ``yaml.CSafeLoader`` also composes nodes in C, which would bypass the
+        alias limit, so only parsing is done by libyaml here.
+        """
 
-def _check_file_size(file_path: Path) -> None:
-    size = file_path.stat().st_size
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+    return CLimitedAliasLoader
+
+
+def _check_file_size(file_path: Path, f: BinaryIO) -> None:
+    # fstat the open file, so the size checked is the size of what is read.
+    size = os.fstat(f.fileno()).st_size
     if size > MAX_FILE_BYTES:
         raise ValueError(
             f"File too large: {file_path} ({size} bytes > {MAX_FILE_BYTES} bytes)"
@@ -82,15 +156,107 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# isatty() result for the current sys.stdout. It is re-checked only when
+# sys.stdout is replaced, e.g. by ``serve`` capturing a command's output.
+_color_stream: Any = None
+_color_enabled = False
+
+
+def _use_color() -> bool:
+    global _color_stream, _color_enabled
+    if sys.stdout is not _color_stream:
+        _color_stream = sys.stdout
+        _color_enabled = _color_stream.isatty()
+    return _color_enabled
+
+
 def colorize(text: str, color: str) -> str:
     """Add color to text if terminal supports it."""
-    if sys.stdout.isatty():
+    if _use_color():
         return f"{color}{text}{Colors.RESET}"
     return text
 
 
+class _Labels(NamedTuple):
+    """Fixed result markers, rendered once with and once without color."""
+
+    tick: str
+    cross: str
+    valid: str
+    invalid: str
+    warning: str
+
+
+def _render_labels(color: bool) -> _Labels:
+    def paint(text: str, code: str) -> str:
+        return f"{code}{text}{Colors.RESET}" if color else text
+
+    return _Labels(
+        tick=paint('✓', Colors.GREEN),
+        cross=paint('✗', Colors.RED),
+        valid=paint('Valid', Colors.GREEN),
+        invalid=paint('Invalid', Colors.RED),
+        warning=paint('Warning:', Colors.YELLOW),
+    )
+
+
+_COLOR_LABELS = _render_labels(True)
+_PLAIN_LABELS = _render_labels(False)
+
+
+def _labels() -> _Labels:
+    return _COLOR_LABELS if _use_color() else _PLAIN_LABELS
+
+
+# Parsed schemas keyed by (resolved path, mtime) and compiled validators keyed
+# by (id(schema), definition). Long-lived callers such as ``serve`` reuse them.
+_SCHEMA_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_VALIDATOR_CACHE: Dict[Tuple[int, Optional[str]], Tuple[Dict[str, Any], _validator.Validator]] = {}
+
+# Expected protocol schema_version per schema, keyed by id(schema). Kept
+# beside the schema rather than in it, since cached schemas are shared.
+_EXPECTED_VERSION_CACHE: Dict[int, Tuple[Dict[str, Any], Optional[str]]] = {}
+_SCHEMA_ID_VERSION_RE = re.compile(r"/v(\d+\.\d+\.\d+)/")
+
+
+# orjson releases before this have no nesting limit and crash on deeply
+# nested input (CVE-2024-27454).
+_ORJSON_MIN_VERSION = (3, 9, 15)
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """Return the optional orjson module, or None if missing or too old.
+
+    Imported on first parse rather than at start-up; the json module is enough.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    version = tuple(int(part) for part in re.findall(r"\d+", orjson.__version__)[:3])
+    return orjson if version >= _ORJSON_MIN_VERSION else None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when a safe version is installed."""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, >64-bit ints and deep nesting; json has the
+            # final say (and reports deep nesting as a RecursionError).
+            pass
+    return json.loads(data.decode('utf-8'))
+
+
 def load_schema(schema_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load the RUP JSON Schema."""
+    """Load the RUP JSON Schema.
+
+    The parsed schema is cached until the file changes on disk; treat the
+    returned dict as read-only.
+    """
     if schema_path is None:
         # Look for schema one level above (repo root)
         schema_path = Path(__file__).parent.parent / "rup-schema.json"
@@ -98,35 +264,101 @@ def load_schema(schema_path: Optional[Path] = None) -> Dict[str, Any]:
     if not schema_path.exists():
         raise FileNotFoundError(f"Schema not found: {schema_path}")
     
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    key = (str(schema_path.resolve()), schema_path.stat().st_mtime_ns)
+    schema = _SCHEMA_CACHE.get(key)
+    if schema is None:
+        with open(schema_path, 'rb') as f:
+            schema = _json_loads(f.read())
+        _SCHEMA_CACHE[key] = schema
+    return schema
+
+
+def _target_schema(schema: Dict[str, Any], def_name: Optional[str]) -> Dict[str, Any]:
+    """Return the schema itself, or a wrapper selecting one of its ``$defs``."""
+    if def_name is None:
+        return schema
+    # Create a wrapper schema that references the definition
+    # This allows the validator to properly resolve $refs
+    return {
+        "$ref": f"#/$defs/{def_name}",
+        "$defs": schema.get("$defs", {})
+    }
+
+
+def get_validator(schema: Dict[str, Any], def_name: Optional[str] = None) -> _validator.Validator:
+    """Return a cached validator for the schema, or for one of its ``$defs``."""
+    key = (id(schema), def_name)
+    cached = _VALIDATOR_CACHE.get(key)
+    # The schema is kept in the entry so its id() cannot be reused while cached.
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    validator = _validator.compile(_target_schema(schema, def_name))
+    _VALIDATOR_CACHE[key] = (schema, validator)
+    return validator
+
+
+def collect_errors(
+    data: Any,
+    schema: Dict[str, Any],
+    def_name: Optional[str] = None,
+    validator: Optional[_validator.Validator] = None,
+    limit: Optional[int] = None
+) -> List[SchemaError]:
+    """Validate data, returning its schema errors (empty when valid).
+
+    ``validator``, if given, must have been compiled from ``schema`` (and
+    ``def_name``); otherwise the cached one from ``get_validator`` is used.
+    With ``limit``, at most that many errors are collected.
+    """
+    if validator is None:
+        validator = get_validator(schema, def_name)
+    # Errors are produced lazily, so a limit also bounds the work done.
+    return list(itertools.islice(validator.iter_errors(data), limit))
+
+
+def check_valid(
+    data: Any,
+    schema: Dict[str, Any],
+    def_name: Optional[str] = None,
+    validator: Optional[_validator.Validator] = None
+) -> bool:
+    """Return whether data is valid, without building any error objects."""
+    if validator is None:
+        validator = get_validator(schema, def_name)
+    return validator.is_valid(data)
 
 
 def load_yaml(file_path: Path) -> Dict[str, Any]:
     """Load a YAML file."""
-    _check_file_size(file_path)
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=LimitedAliasLoader)
+    # A binary stream lets the parser detect the encoding and read bytes
+    # directly, while error marks still name the file.
+    import yaml  # deferred, see _yaml_loader
+
+    loader = _yaml_loader()
+    with open(file_path, 'rb') as f:
+        _check_file_size(file_path, f)
+        return yaml.load(f, Loader=loader)
 
 
 def load_json(file_path: Path) -> Dict[str, Any]:
     """Load a JSON file."""
-    _check_file_size(file_path)
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        _check_file_size(file_path, f)
+        return _json_loads(f.read())
 
 
-def format_validation_error(error: ValidationError, indent: int = 0) -> str:
+def format_validation_error(error: SchemaError, indent: int = 0) -> str:
     """Format a validation error for display."""
     prefix = "  " * indent
     # Path in the instance (file being validated)
-    path = ".".join(str(p) for p in error.absolute_path) or "(root)"
+    path = ".".join(str(p) for p in error.instance_path) or "(root)"
     
     # Path in the schema that triggered the error
     schema_path = ".".join(str(p) for p in error.schema_path)
     
     lines = [
-        f"{prefix}{colorize('✗', Colors.RED)} {colorize(path, Colors.CYAN)}",
+        f"{prefix}{_labels().cross} {colorize(path, Colors.CYAN)}",
         f"{prefix}  Message: {error.message}",
     ]
     
@@ -139,11 +371,11 @@ def format_validation_error(error: ValidationError, indent: int = 0) -> str:
     return "\n".join(lines)
 
 
-def validate_protocol(
-    protocol_data: Dict[str, Any],
-    schema: Dict[str, Any]
-) -> Tuple[bool, List[ValidationError]]:
-    """Validate a protocol definition against the schema."""
+def _expected_schema_version(schema: Dict[str, Any]) -> Optional[str]:
+    """Return the protocol ``schema_version`` the schema expects, if any."""
+    cached = _EXPECTED_VERSION_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
 
     # Enforce schema version (derive expected version from the schema $id).
     # This keeps the validator behavior consistent when the schema is upgraded.
@@ -156,95 +388,162 @@ def validate_protocol(
     else:
         schema_id = schema.get("$id")
         if isinstance(schema_id, str):
-            import re
-            m = re.search(r"/v(\d+\.\d+\.\d+)/", schema_id)
+            m = _SCHEMA_ID_VERSION_RE.search(schema_id)
             if m:
                 expected_version = m.group(1)
 
+    _EXPECTED_VERSION_CACHE[id(schema)] = (schema, expected_version)
+    return expected_version
+
+
+def validate_protocol(
+    protocol_data: Dict[str, Any],
+    schema: Dict[str, Any],
+    validator: Optional[_validator.Validator] = None,
+    with_errors: bool = True,
+    full_errors: bool = False,
+    max_errors: Optional[int] = None
+) -> Tuple[bool, List[SchemaError]]:
+    """Validate a protocol definition against the schema.
+
+    Pass ``validator`` (from ``get_validator(schema)``) to skip the lookup
+    when validating many files. With ``with_errors=False`` only pass/fail is
+    computed and the error list is always empty. A ``schema_version``
+    mismatch is reported on its own unless ``full_errors`` is set.
+    ``max_errors`` caps how many errors are collected.
+    """
+    expected_version = _expected_schema_version(schema)
     if expected_version and 'schema_version' in protocol_data:
         version = protocol_data['schema_version']
         if version != expected_version:
-            error = ValidationError(
+            error = SchemaError(
                 f"Schema version mismatch. Expected {expected_version}, got {version}",
+                schema_path=("properties", "schema_version"),
                 validator="const",
                 validator_value=expected_version,
-                instance=version,
-                schema_path=["properties", "schema_version"]
             )
-            validator = Draft202012Validator(schema)
-            errors = list(validator.iter_errors(protocol_data))
+            if not with_errors:
+                return False, []
+            if not full_errors:
+                # The document targets another schema; further errors are noise.
+                return False, [error]
+            errors = collect_errors(
+                protocol_data, schema, validator=validator,
+                limit=None if max_errors is None else max_errors - 1
+            )
             errors.insert(0, error)
             return False, errors
 
-    validator = Draft202012Validator(schema)
-    errors = list(validator.iter_errors(protocol_data))
+    if not with_errors:
+        return check_valid(protocol_data, schema, validator=validator), []
+    errors = collect_errors(protocol_data, schema, validator=validator, limit=max_errors)
     return len(errors) == 0, errors
 
 
 def validate_agent_output(
     output_data: Dict[str, Any],
     output_type: str,
-    schema: Dict[str, Any]
-) -> Tuple[bool, List[ValidationError]]:
-    """Validate an agent output against the appropriate sub-schema."""
-    # Map output types to schema definitions
-    type_map = {
-        'discovery': 'DiscoveryReport',
-        'plan': 'PlanOutput',
-        'execution': 'ExecutionOutput',
-        'verification': 'VerificationOutput'
-    }
-    
-    if output_type not in type_map:
-        raise ValueError(f"Unknown output type: {output_type}. Valid types: {list(type_map.keys())}")
+    schema: Dict[str, Any],
+    validator: Optional[_validator.Validator] = None,
+    with_errors: bool = True,
+    max_errors: Optional[int] = None
+) -> Tuple[bool, List[SchemaError]]:
+    """Validate an agent output against the appropriate sub-schema.
+
+    ``validator``, ``with_errors`` and ``max_errors`` behave as in
+    ``validate_protocol``.
+    """
+    if output_type not in _VALID_TYPES:
+        raise ValueError(f"Unknown output type: {output_type}. Valid types: {list(_TYPE_MAP.keys())}")
     
-    def_name = type_map[output_type]
+    def_name = _TYPE_MAP[output_type]
     
     if '$defs' not in schema or def_name not in schema['$defs']:
         raise ValueError(f"Schema definition not found: {def_name}")
     
-    # Create a wrapper schema that references the definition
-    # This allows the validator to properly resolve $refs
-    wrapper_schema = {
-        "$ref": f"#/$defs/{def_name}",
-        "$defs": schema.get("$defs", {})
-    }
+    if not with_errors:
+        return check_valid(output_data, schema, def_name, validator), []
+    errors = collect_errors(output_data, schema, def_name, validator, max_errors)
+    return len(errors) == 0, errors
+
+
+def _error_limit(verbose: bool) -> Optional[int]:
+    """Errors worth collecting per file: one past what ``print_result`` shows."""
+    return None if verbose else ERROR_DISPLAY_LIMIT + 1
+
+
+def _screen_then_collect(
+    validate: Callable[..., Tuple[bool, List[SchemaError]]],
+    max_errors: Optional[int]
+) -> Tuple[bool, List[SchemaError]]:
+    """Run a ``validate_protocol``/``validate_agent_output`` partial.
+
+    Most files pass, so a pass/fail check runs first and errors are only
+    collected for the files that fail.
+    """
+    valid, errors = validate(with_errors=False)
+    if not valid:
+        valid, errors = validate(max_errors=max_errors)
+    return valid, errors
+
+
+def _format_result(
+    file_path: Path,
+    valid: bool,
+    errors: Iterable[SchemaError],
+    verbose: bool = False
+) -> str:
+    """Render what ``print_result`` prints, newline-terminated."""
+    labels = _labels()
+    if valid:
+        return f"{labels.tick} {colorize(str(file_path), Colors.BOLD)}: {labels.valid}\n"
     
-    validator = Draft202012Validator(wrapper_schema)
+    lines = [f"{labels.cross} {colorize(str(file_path), Colors.BOLD)}: {labels.invalid}"]
     
-    errors = list(validator.iter_errors(output_data))
-    return len(errors) == 0, errors
+    # Show first ERROR_DISPLAY_LIMIT errors by default, all if verbose
+    shown = list(itertools.islice(errors, _error_limit(verbose)))
+    truncated = not verbose and len(shown) > ERROR_DISPLAY_LIMIT
+    if truncated:
+        lines.append(f"  Found more than {ERROR_DISPLAY_LIMIT} errors:")
+        del shown[ERROR_DISPLAY_LIMIT:]
+    else:
+        lines.append(f"  Found {len(shown)} error(s):")
+    
+    lines.extend(format_validation_error(error, indent=1) for error in shown)
+    
+    if truncated:
+        lines.append("  ... and more errors (use --verbose to see all)")
+    lines.append("")
+    return "\n".join(lines)
 
 
 def print_result(
     file_path: Path,
     valid: bool,
-    errors: List[ValidationError],
+    errors: Iterable[SchemaError],
     verbose: bool = False
 ) -> None:
-    """Print validation result."""
-    if valid:
-        print(f"{colorize('✓', Colors.GREEN)} {colorize(str(file_path), Colors.BOLD)}: {colorize('Valid', Colors.GREEN)}")
-    else:
-        print(f"{colorize('✗', Colors.RED)} {colorize(str(file_path), Colors.BOLD)}: {colorize('Invalid', Colors.RED)}")
-        print(f"  Found {len(errors)} error(s):")
-        
-        # Show first 10 errors by default, all if verbose
-        display_errors = errors if verbose else errors[:10]
-        for error in display_errors:
-            print(format_validation_error(error, indent=1))
-        
-        if not verbose and len(errors) > 10:
-            print(f"  ... and {len(errors) - 10} more errors (use --verbose to see all)")
+    """Print validation result.
+
+    ``errors`` may be a lazy iterable; without ``verbose`` at most
+    ``ERROR_DISPLAY_LIMIT + 1`` items are read from it. The result is
+    written with a single call.
+    """
+    sys.stdout.write(_format_result(file_path, valid, errors, verbose))
 
 
 def cmd_validate_protocol(args: argparse.Namespace) -> int:
     """Validate a protocol YAML file."""
+    import yaml  # deferred, see _yaml_loader
+
     try:
         schema = load_schema(args.schema)
         protocol = load_yaml(Path(args.file))
         
-        valid, errors = validate_protocol(protocol, schema)
+        valid, errors = _screen_then_collect(
+            functools.partial(validate_protocol, protocol, schema, full_errors=args.full_errors),
+            _error_limit(args.verbose),
+        )
         print_result(Path(args.file), valid, errors, args.verbose)
         
         return 0 if valid else 1
@@ -266,7 +565,10 @@ def cmd_validate_output(args: argparse.Namespace) -> int:
         schema = load_schema(args.schema)
         output = load_json(Path(args.file))
         
-        valid, errors = validate_agent_output(output, args.type, schema)
+        valid, errors = _screen_then_collect(
+            functools.partial(validate_agent_output, output, args.type, schema),
+            _error_limit(args.verbose),
+        )
         print_result(Path(args.file), valid, errors, args.verbose)
         
         return 0 if valid else 1
@@ -285,6 +587,87 @@ def cmd_validate_output(args: argparse.Namespace) -> int:
         return 1
 
 
+# Output file name prefixes and the output type each implies, checked in order.
+_OUTPUT_PREFIXES = (
+    ("discovery", "discovery"),
+    ("plan", "plan"),
+    ("execution", "execution"),
+    ("changes", "execution"),
+    ("verification", "verification"),
+    ("report", "verification"),
+)
+
+
+def _classify(name: str) -> Optional[str]:
+    """Return the kind of file ``all`` validates ``name`` as, or None to skip it."""
+    if name.endswith((".yaml", ".yml")):
+        return 'protocol' if "protocol" in name.lower() else None
+    if name.endswith(".json"):
+        for prefix, output_type in _OUTPUT_PREFIXES:
+            if name.startswith(prefix):
+                return output_type
+    return None
+
+
+def _compile_validators(schema: Dict[str, Any]) -> Dict[str, _validator.Validator]:
+    """Compile (or fetch cached) validators keyed by file kind."""
+    validators = {'protocol': get_validator(schema)}
+    for output_type, def_name in _TYPE_MAP.items():
+        if def_name in schema.get('$defs', {}):
+            validators[output_type] = get_validator(schema, def_name)
+    return validators
+
+
+def _validate_one(
+    file_path: Path,
+    kind: str,
+    schema_path: Optional[Path],
+    full_errors: bool = False,
+    max_errors: Optional[int] = None
+) -> Tuple[Path, bool, List[SchemaError], Optional[str]]:
+    """Validate one file for ``cmd_validate_all``.
+
+    Returns ``(path, valid, errors, failure)`` where ``failure`` is the reason
+    the file could not be validated at all. Everything returned is picklable
+    so this can run in a worker process; the schema and its validators are
+    cached per process.
+    """
+    try:
+        schema = load_schema(schema_path)
+        validator = _compile_validators(schema).get(kind)
+        if kind == 'protocol':
+            validate = functools.partial(
+                validate_protocol, load_yaml(file_path), schema, validator, full_errors=full_errors
+            )
+        else:
+            validate = functools.partial(validate_agent_output, load_json(file_path), kind, schema, validator)
+        valid, errors = _screen_then_collect(validate, max_errors)
+    except Exception as e:
+        return file_path, False, [], str(e)
+    return file_path, valid, errors, None
+
+
+def _pool_outcomes(
+    outcomes: Iterable[Tuple[Path, bool, List[SchemaError], Optional[str]]],
+    paths: List[Path]
+) -> Iterable[Tuple[Path, bool, List[SchemaError], Optional[str]]]:
+    """Yield ``_validate_one`` results from a process pool, in ``paths`` order.
+
+    If a worker dies (a crash in a C extension, or out of memory) the pool is
+    unusable; every file still without a result is reported as a failure.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    done = 0
+    try:
+        for outcome in outcomes:
+            yield outcome
+            done += 1
+    except BrokenProcessPool:
+        for file_path in paths[done:]:
+            yield file_path, False, [], "not validated, a validator worker process crashed"
+
+
 def cmd_validate_all(args: argparse.Namespace) -> int:
     """Validate all protocol and output files in a directory."""
     directory = Path(args.directory)
@@ -293,57 +676,58 @@ def cmd_validate_all(args: argparse.Namespace) -> int:
         return 1
     
     try:
-        schema = load_schema(args.schema)
+        # Compile every validator once up front rather than per file.
+        _compile_validators(load_schema(args.schema))
     except FileNotFoundError as e:
         print(f"{colorize('Error:', Colors.RED)} {e}")
         return 1
     
-    results = []
+    # Walk the tree once, classifying each file by name.
+    work: List[Tuple[Path, str]] = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for name in sorted(filenames):
+            kind = _classify(name)
+            if kind is not None:
+                work.append((Path(dirpath) / name, kind))
+    
+    paths = [file_path for file_path, _ in work]
+    kinds = [kind for _, kind in work]
+    validate_file = functools.partial(
+        _validate_one,
+        schema_path=args.schema,
+        full_errors=args.full_errors,
+        max_errors=_error_limit(args.verbose),
+    )
+    # Results as parallel arrays; errors are kept only for invalid files.
+    result_paths: List[Path] = []
+    valid_flags = bytearray()
+    errors_map: Dict[int, List[SchemaError]] = {}
     parse_errors = 0  # Track files that failed to parse
     
-    # Find and validate protocol files
-    for yaml_file in directory.glob("**/*.yaml"):
-        if "protocol" in yaml_file.name.lower():
-            try:
-                protocol = load_yaml(yaml_file)
-                valid, errors = validate_protocol(protocol, schema)
-                results.append((yaml_file, valid, errors))
-            except Exception as e:
-                print(f"{colorize('Warning:', Colors.YELLOW)} Could not validate {yaml_file}: {e}")
-                parse_errors += 1
-    
-    for yml_file in directory.glob("**/*.yml"):
-        if "protocol" in yml_file.name.lower():
-            try:
-                protocol = load_yaml(yml_file)
-                valid, errors = validate_protocol(protocol, schema)
-                results.append((yml_file, valid, errors))
-            except Exception as e:
-                print(f"{colorize('Warning:', Colors.YELLOW)} Could not validate {yml_file}: {e}")
-                parse_errors += 1
-    
-    # Find and validate output files
-    output_patterns = [
-        ("discovery", "**/discovery*.json"),
-        ("plan", "**/plan*.json"),
-        ("execution", "**/execution*.json"),
-        ("execution", "**/changes*.json"),
-        ("verification", "**/verification*.json"),
-        ("verification", "**/report*.json"),
-    ]
-    
-    for output_type, pattern in output_patterns:
-        for json_file in directory.glob(pattern):
-            try:
-                output = load_json(json_file)
-                valid, errors = validate_agent_output(output, output_type, schema)
-                results.append((json_file, valid, errors))
-            except Exception as e:
-                print(f"{colorize('Warning:', Colors.YELLOW)} Could not validate {json_file}: {e}")
+    with contextlib.ExitStack() as stack:
+        if len(work) > PARALLEL_THRESHOLD:
+            # Files are independent; spread parsing and validation across CPUs.
+            # Imported here: multiprocessing is slow to import and rarely needed.
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = stack.enter_context(ProcessPoolExecutor())
+            outcomes = _pool_outcomes(executor.map(validate_file, paths, kinds, chunksize=8), paths)
+        else:
+            outcomes = map(validate_file, paths, kinds)
+        
+        for file_path, valid, errors, failure in outcomes:
+            if failure is not None:
+                print(f"{_labels().warning} Could not validate {file_path}: {failure}")
                 parse_errors += 1
+                continue
+            if not valid:
+                errors_map[len(result_paths)] = errors
+            result_paths.append(file_path)
+            valid_flags.append(valid)
     
     # Print results
-    if not results:
+    if not result_paths:
         print(f"{colorize('Warning:', Colors.YELLOW)} No files found to validate in {directory}")
         if parse_errors > 0:
             print(f"  {colorize('⚠', Colors.YELLOW)} Parse errors: {parse_errors}")
@@ -353,15 +737,17 @@ def cmd_validate_all(args: argparse.Namespace) -> int:
     print(f"\n{colorize('Validation Results', Colors.BOLD)}")
     print("=" * 50)
     
-    total_valid = 0
-    total_invalid = 0
+    # Write the report in batches instead of a few writes per file.
+    batch: List[str] = []
+    for index, file_path in enumerate(result_paths):
+        batch.append(_format_result(file_path, valid_flags[index], errors_map.get(index, ()), args.verbose))
+        if len(batch) >= OUTPUT_BATCH_FILES:
+            sys.stdout.write("".join(batch))
+            batch.clear()
+    sys.stdout.write("".join(batch))
     
-    for file_path, valid, errors in results:
-        print_result(file_path, valid, errors, args.verbose)
-        if valid:
-            total_valid += 1
-        else:
-            total_invalid += 1
+    total_valid = sum(valid_flags)
+    total_invalid = len(valid_flags) - total_valid
     
     print("=" * 50)
     print(f"Total: {total_valid + total_invalid} files")
@@ -469,6 +855,53 @@ def cmd_sample(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Serve validation requests as JSON lines on stdin/stdout.
+
+    Each request is one line such as
+    ``{"cmd": "output", "path": "discovery.json", "type": "discovery"}``
+    and is answered with one ``{"code": <exit code>, "stdout": <output>}`` line.
+    Keeping one process alive avoids paying interpreter start-up per file.
+    """
+    handlers = {
+        'protocol': cmd_validate_protocol,
+        'output': cmd_validate_output,
+        'all': cmd_validate_all,
+    }
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        buffer = io.StringIO()
+        try:
+            request = json.loads(line)
+            handler = handlers[request['cmd']]
+            if not isinstance(request.get('path'), str):
+                raise TypeError("'path' must be a string")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            code = 2
+            buffer.write(f"Error: Invalid request: {e}\n")
+        else:
+            request_args = argparse.Namespace(
+                schema=args.schema,
+                verbose=request.get('verbose', args.verbose),
+                full_errors=request.get('full_errors', args.full_errors),
+                file=request.get('path'),
+                directory=request.get('path'),
+                type=request.get('type'),
+            )
+            with contextlib.redirect_stdout(buffer):
+                try:
+                    code = handler(request_args)
+                except Exception as e:  # one bad request must not stop the server
+                    code = 2
+                    print(f"Error: {e}")
+        sys.stdout.write(json.dumps({"code": code, "stdout": buffer.getvalue()}) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -481,6 +914,7 @@ Examples:
   %(prog)s output plan.json plan
   %(prog)s all ./my-project
   %(prog)s sample discovery -o sample_discovery.json
+  %(prog)s serve < requests.jsonl
         """
     )
     
@@ -495,6 +929,11 @@ Examples:
         action='store_true',
         help='Show all validation errors'
     )
+    parser.add_argument(
+        '--full-errors',
+        action='store_true',
+        help='Also validate protocols whose schema_version does not match the schema'
+    )
     
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
@@ -507,7 +946,7 @@ Examples:
     output_parser.add_argument('file', help='Path to output JSON file')
     output_parser.add_argument(
         'type',
-        choices=['discovery', 'plan', 'execution', 'verification'],
+        choices=list(_TYPE_MAP),
         help='Type of output'
     )
     
@@ -527,6 +966,9 @@ Examples:
         help='Output file path'
     )
     
+    # Long-lived JSON-lines server
+    subparsers.add_parser('serve', help='Validate JSON-line requests read from stdin')
+    
     args = parser.parse_args()
     
     if args.command is None:
@@ -538,6 +980,7 @@ Examples:
         'output': cmd_validate_output,
         'all': cmd_validate_all,
         'sample': cmd_sample,
+        'serve': cmd_serve,
     }
     
     return commands[args.command](args)